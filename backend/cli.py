@@ -5,12 +5,18 @@ Provides a way to test the backend endpoints directly from the terminal.
 """
 
 import argparse
-import json
+import contextlib
+import orjson
 from datetime import datetime, timedelta
 import sys
 import os
+import time
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
-from tqdm import tqdm
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 # Configure logging
@@ -23,6 +29,34 @@ logger = logging.getLogger('cli')
 # Default API URL
 API_URL = os.environ.get('API_URL', 'http://localhost:5000/api/v1')
 
+# Shared session so requests reuse pooled keep-alive connections.
+# Retry only covers idempotent methods, so fetch-data POSTs are never sent twice.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers['Accept-Encoding'] = 'br, gzip'
+# (connect, read) seconds; without one a stalled server would hang the CLI forever
+REQUEST_TIMEOUT = (5, 60)
+
+# Day-of-week bars are drawn from a table of every possible length
+DAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+BAR_WIDTH = 40
+BARS = tuple('█' * length for length in range(BAR_WIDTH + 1))
+
+# Fetch jobs are polled every few seconds. A job still queued after JOB_QUEUED_TIMEOUT means no
+# worker picked it up; the job's own timeout is taken from the API's 202 response
+JOB_POLL_INTERVAL = 2
+JOB_QUEUED_TIMEOUT = 60
+DEFAULT_JOB_TIMEOUT = 3600
+
+# Fields printed for each deviating commit
+DEVIATION_FIELDS = itemgetter('sha', 'z_score', 'total_changes', 'title')
+
 def parse_date(date_str):
     """Parse date string in YYYY-MM-DD format."""
     try:
@@ -33,7 +67,7 @@ def parse_date(date_str):
 
 def format_json(json_data):
     """Format JSON data for pretty printing."""
-    return json.dumps(json_data, indent=2, sort_keys=True)
+    return orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
 
 def get_authors(args):
     """Get unique commit authors within date range."""
@@ -44,17 +78,17 @@ def get_authors(args):
         params['end_date'] = args.end_date
     
     try:
-        response = requests.get(f"{API_URL}/authors", params=params)
+        response = SESSION.get(f"{API_URL}/authors", params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         print(f"\nFound {data['count']} unique authors:")
         for i, author in enumerate(data['authors'], 1):
             print(f"{i}. {author}")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"\nResults saved to {args.output}")
     
     except requests.exceptions.RequestException as e:
@@ -63,6 +97,39 @@ def get_authors(args):
             logger.error(f"Response: {e.response.text}")
         sys.exit(1)
 
+def format_deviation(i, commit):
+    """One numbered line of the deviations listing."""
+    sha, z_score, changes, title = DEVIATION_FIELDS(commit)
+    return f"{i}. {sha[:7]} | Z-score: {z_score} | Changes: {changes} | {title[:60]}\n"
+
+def stream_deviations(params, output=None):
+    """
+    Print deviating commits from the NDJSON endpoint as each line arrives,
+    so large ranges are never held in memory. The count is only known at the end.
+    """
+    response = SESSION.get(f"{API_URL}/deviations/stream", params=params, stream=True, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    
+    print("\nCommits with significant deviations (z-score > 2):")
+    count = 0
+    with open(output, 'wb') if output else contextlib.nullcontext() as f:
+        if f:
+            f.write(b'{"commits": [')
+        for line in response.iter_lines():
+            if not line:
+                continue
+            count += 1
+            sys.stdout.write(format_deviation(count, orjson.loads(line)))
+            # Each line is already a JSON document, so it is saved without re-encoding
+            if f:
+                f.write(b', ' + line if count > 1 else line)
+        if f:
+            f.write(b'], "count": %d}' % count)
+    
+    print(f"\nFound {count} commits with significant deviations (z-score > 2)")
+    if output:
+        print(f"\nResults saved to {output}")
+
 def get_deviations(args):
     """Get commits with significant deviations."""
     params = {}
@@ -72,17 +139,23 @@ def get_deviations(args):
         params['end_date'] = args.end_date
     
     try:
-        response = requests.get(f"{API_URL}/deviations", params=params)
+        if args.stream:
+            stream_deviations(params, args.output)
+            return
+        
+        response = SESSION.get(f"{API_URL}/deviations", params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         print(f"\nFound {data['count']} commits with significant deviations (z-score > 2):")
-        for i, commit in enumerate(data['commits'], 1):
-            print(f"{i}. {commit['sha'][:7]} | Z-score: {commit['z_score']} | Changes: {commit['total_changes']} | {commit['title'][:60]}")
+        # Rows are written as they are formatted, so large listings are never joined into one string
+        sys.stdout.writelines(
+            format_deviation(i, commit) for i, commit in enumerate(data['commits'], 1)
+        )
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"\nResults saved to {args.output}")
     
     except requests.exceptions.RequestException as e:
@@ -92,10 +165,8 @@ def get_deviations(args):
         sys.exit(1)
 
 def get_day_of_week(args):
-    """Get activity by day of week."""
-    params = {
-        'metric_type': args.metric_type
-    }
+    """Get activity by day of week for one or more metrics."""
+    params = {}
     if args.start_date:
         params['start_date'] = args.start_date
     if args.end_date:
@@ -103,28 +174,36 @@ def get_day_of_week(args):
     if args.author:
         params['author'] = args.author
     
-    try:
-        response = requests.get(f"{API_URL}/day-of-week", params=params)
+    def fetch_metric(metric_type):
+        response = SESSION.get(f"{API_URL}/day-of-week", params=dict(params, metric_type=metric_type),
+                               timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        
-        print(f"\nActivity by day of week ({data['metric']})")
-        if data['author']:
-            print(f"Author: {data['author']}")
-        
-        days = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-        max_value = max(data['day_activity'].values())
-        scale_factor = 40 / max_value if max_value > 0 else 1
+        return orjson.loads(response.content)
+    
+    try:
+        # Metrics are independent requests, so they are fetched concurrently and printed in order
+        with ThreadPoolExecutor(max_workers=len(args.metric_type)) as executor:
+            results = list(executor.map(fetch_metric, args.metric_type))
         
-        for day in days:
-            value = data['day_activity'].get(day, 0)
-            bar_length = int(value * scale_factor)
-            bar = '█' * bar_length
-            print(f"{day.ljust(10)}: {bar} {value}")
+        for data in results:
+            print(f"\nActivity by day of week ({data['metric']})")
+            if data['author']:
+                print(f"Author: {data['author']}")
+            
+            values = [data['day_activity'].get(day, 0) for day in DAYS]
+            max_value = max(values)
+            scale_factor = BAR_WIDTH / max_value if max_value > 0 else 1
+            
+            print('\n'.join(
+                f"{day.ljust(10)}: {BARS[int(value * scale_factor)]} {value}"
+                for day, value in zip(DAYS, values)
+            ))
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(data, f, indent=2)
+            # A single metric keeps the endpoint's response shape; several are keyed by metric
+            data = results[0] if len(results) == 1 else {data['metric']: data for data in results}
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"\nResults saved to {args.output}")
     
     except requests.exceptions.RequestException as e:
@@ -142,20 +221,20 @@ def get_word_frequencies(args):
         params['end_date'] = args.end_date
     
     try:
-        response = requests.get(f"{API_URL}/word-frequencies", params=params)
+        response = SESSION.get(f"{API_URL}/word-frequencies", params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
-        word_freqs = data['word_frequencies']
-        sorted_words = sorted(word_freqs.items(), key=lambda x: x[1], reverse=True)
+        # Only the top 20 are printed, so a heap avoids sorting the whole vocabulary
+        top_words = heapq.nlargest(20, data['word_frequencies'].items(), key=itemgetter(1))
         
         print("\nWord frequencies in commit messages:")
-        for i, (word, freq) in enumerate(sorted_words[:20], 1):
+        for i, (word, freq) in enumerate(top_words, 1):
             print(f"{i}. {word}: {freq}")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"\nResults saved to {args.output}")
     
     except requests.exceptions.RequestException as e:
@@ -179,9 +258,34 @@ def fetch_data(args):
     
     try:
         print("Fetching data from GitHub API. This may take a while...")
-        response = requests.post(f"{API_URL}/fetch-data", json=payload)
+        response = SESSION.post(f"{API_URL}/fetch-data", json=payload, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
+        
+        # The fetch runs on the worker; poll the job until it is done
+        if response.status_code == 202:
+            job_id = data['job_id']
+            print(f"Queued as job {job_id}, waiting for it to finish...")
+            queued_deadline = time.monotonic() + JOB_QUEUED_TIMEOUT
+            deadline = queued_deadline + data.get('job_timeout', DEFAULT_JOB_TIMEOUT)
+            while True:
+                time.sleep(JOB_POLL_INTERVAL)
+                status_response = SESSION.get(f"{API_URL}/fetch-data/{job_id}", timeout=REQUEST_TIMEOUT)
+                status_response.raise_for_status()
+                job = orjson.loads(status_response.content)
+                if job['status'] == 'finished':
+                    data = job['result']
+                    break
+                if job['status'] in ('failed', 'stopped', 'canceled'):
+                    logger.error(f"Fetch job {job_id} {job['status']}: {job.get('message', '')}")
+                    sys.exit(1)
+                if job['status'] == 'queued' and time.monotonic() > queued_deadline:
+                    logger.error(f"Fetch job {job_id} was not picked up within {JOB_QUEUED_TIMEOUT} seconds. "
+                                 f"Is a worker running? Start one with: rq worker github --url $REDIS_URL")
+                    sys.exit(1)
+                if time.monotonic() > deadline:
+                    logger.error(f"Fetch job {job_id} did not finish in time (last status: {job['status']})")
+                    sys.exit(1)
         
         print("\nData fetch result:")
         print(f"Status: {data['status']}")
@@ -203,8 +307,8 @@ def fetch_data(args):
                     print(f"  {key}: {value}")
         
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             print(f"\nResults saved to {args.output}")
     
     except requests.exceptions.RequestException as e:
@@ -253,6 +357,11 @@ def main():
         help='Get commits with significant deviations'
     )
     add_common_args(dev_parser)
+    dev_parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Use the NDJSON streaming endpoint (for large date ranges)'
+    )
     dev_parser.set_defaults(func=get_deviations)
     
     # Day of week command
@@ -264,8 +373,9 @@ def main():
     dow_parser.add_argument(
         '--metric-type', '-m',
         required=True,
+        nargs='+',
         choices=['commits', 'additions', 'deletions', 'total_changes'],
-        help='Metric type to analyze'
+        help='Metric types to analyze; several are fetched concurrently'
     )
     dow_parser.add_argument(
         '--author', '-a',
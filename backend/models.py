@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, CHAR, Date, DateTime, Text, Float, ForeignKey, Boolean, Index, UniqueConstraint, Computed
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -13,7 +13,7 @@ class Commit(Base):
     __tablename__ = 'commits'
 
     id = Column(Integer, primary_key=True)
-    sha = Column(String(40), unique=True, nullable=False)
+    sha = Column(CHAR(40), unique=True, nullable=False)  # Always a full 40 character hex digest
     author_name = Column(String(255), nullable=False)
     author_email = Column(String(255), nullable=True)
     author_date = Column(DateTime, nullable=False)
@@ -21,13 +21,31 @@ class Commit(Base):
     message_body = Column(Text, nullable=True)
     additions = Column(Integer, default=0)
     deletions = Column(Integer, default=0)
-    total_changes = Column(Integer, default=0)  # Calculated field (additions + deletions)
-    repository = Column(String(255), nullable=False)
+    total_changes = Column(Integer, Computed('additions + deletions', persisted=True))  # Generated by PostgreSQL
+    repository = Column(String(140), nullable=False)  # owner/name, at most 39 + 1 + 100 characters
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Statistical data
     z_score = Column(Float, nullable=True)  # For endpoint 2 - significant deviations
 
+    __table_args__ = (
+        # Range scans for the per-repository cache and statistics queries
+        Index('commits_repo_date_idx', 'repository', 'author_date'),
+        # Covering indexes so the analytics endpoints can use index-only scans
+        Index('commits_author_date_idx', 'author_date',
+              postgresql_include=['author_name', 'additions', 'deletions', 'total_changes', 'z_score']),
+        Index('commits_author_name_date_idx', 'author_name', 'author_date',
+              postgresql_include=['additions', 'deletions', 'total_changes']),
+        # Partial index: only the outliers served by the deviations endpoint
+        Index('commits_zscore_idx', 'author_date', postgresql_where=(z_score > 2)),
+    )
+
+    # Columns exposed when a commit is returned as a plain dictionary
+    _FIELDS = (
+        'sha', 'author_name', 'author_email', 'author_date', 'message_title', 'message_body',
+        'additions', 'deletions', 'total_changes', 'repository', 'z_score'
+    )
+
     def __repr__(self):
         return f"<Commit sha={self.sha} author={self.author_name}>"
 
@@ -40,12 +58,17 @@ class CacheStatus(Base):
     __tablename__ = 'cache_status'
 
     id = Column(Integer, primary_key=True)
-    repository = Column(String(255), nullable=False)
+    repository = Column(String(140), nullable=False)
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=False)
     last_cursor = Column(String(255), nullable=True)  # For pagination
     completed = Column(Boolean, default=False)
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        # Serves the cache lookup on repository and date range
+        Index('cache_status_repo_range_idx', 'repository', 'start_date', 'end_date'),
+    )
     
     def __repr__(self):
         return f"<CacheStatus repo={self.repository} completed={self.completed}>"
@@ -61,9 +84,73 @@ class CommitWordFrequency(Base):
     id = Column(Integer, primary_key=True)
     word = Column(String(100), nullable=False)
     frequency = Column(Integer, default=0)
-    repository = Column(String(255), nullable=False)
+    repository = Column(String(140), nullable=False)
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('word', 'repository', 'start_date', 'end_date', name='uq_cwf'),
+        # Serves the top-N lookup for a date range without a sort step
+        Index('cwf_range_freq_idx', start_date, end_date, frequency.desc(),
+              postgresql_include=['word']),
+    )
     
     def __repr__(self):
         return f"<CommitWordFrequency word={self.word} frequency={self.frequency}>"
+
+
+class CommitDowRollup(Base):
+    """
+    Per-author, per-day commit totals.
+    Maintained at ingest so the day-of-week endpoint sums a few rows
+    instead of grouping every commit on each request.
+    """
+    __tablename__ = 'commit_dow_rollup'
+
+    author_name = Column(String(255), primary_key=True)
+    day = Column(Date, primary_key=True)
+    dow = Column(SmallInteger, nullable=False)  # 0 = Sunday, matching PostgreSQL's DOW
+    commits = Column(Integer, default=0)
+    additions = Column(Integer, default=0)
+    deletions = Column(Integer, default=0)
+    total_changes = Column(Integer, Computed('additions + deletions', persisted=True))
+
+    def __repr__(self):
+        return f"<CommitDowRollup author={self.author_name} day={self.day}>"
+
+
+class Word(Base):
+    """
+    Distinct words seen in commit messages.
+    Lets commit_words refer to words by integer id.
+    """
+    __tablename__ = 'words'
+
+    id = Column(Integer, primary_key=True)
+    word = Column(Text, unique=True, nullable=False)
+
+    def __repr__(self):
+        return f"<Word id={self.id} word={self.word}>"
+
+
+class CommitWord(Base):
+    """
+    Words of each commit message, tokenized once at ingest.
+    Word frequencies for any date range are summed from here
+    instead of re-tokenizing the messages.
+    """
+    __tablename__ = 'commit_words'
+
+    commit_id = Column(Integer, ForeignKey('commits.id', ondelete='CASCADE'), primary_key=True)
+    word_id = Column(Integer, ForeignKey('words.id'), primary_key=True)
+    repository = Column(String(140), nullable=False)
+    author_date = Column(DateTime, nullable=False)
+    occurrences = Column(Integer, nullable=False, default=1)
+
+    __table_args__ = (
+        Index('commit_words_date_word_idx', 'author_date', 'word_id',
+              postgresql_include=['occurrences']),
+    )
+
+    def __repr__(self):
+        return f"<CommitWord commit_id={self.commit_id} word_id={self.word_id}>"
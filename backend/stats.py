@@ -0,0 +1,55 @@
+"""
+Numerical kernels for commit statistics.
+Uses numba to compile the passes in parallel when it is installed, plain NumPy otherwise.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _moments(x):
+    """Mean and population standard deviation; two reduction passes that numba runs in parallel."""
+    n = x.shape[0]
+    total = 0.0
+    for i in prange(n):
+        total += x[i]
+    mean = total / n
+    m2 = 0.0
+    for i in prange(n):
+        delta = x[i] - mean
+        m2 += delta * delta
+    return mean, np.sqrt(m2 / n)
+
+
+def _moments_numpy(x):
+    """NumPy fallback for when numba is not installed."""
+    return x.mean(), x.std()
+
+
+if njit is not None:
+    # cache=True stores the compiled kernel on disk so workers only pay the compile once
+    moments_kernel = njit(parallel=True, fastmath=True, cache=True)(_moments)
+else:
+    moments_kernel = _moments_numpy
+
+
+def moments(values):
+    """
+    Calculate the mean and population standard deviation of a sequence of values.
+
+    Args:
+        values (array-like): Values to summarise, e.g. total changes per commit
+
+    Returns:
+        tuple: (mean, std)
+    """
+    x = np.ascontiguousarray(values, dtype=np.float64)
+    if x.size == 0:
+        return 0.0, 0.0
+    mean, std = moments_kernel(x)
+    return float(mean), float(std)
@@ -0,0 +1,51 @@
+"""
+Shared pytest setup for the backend tests
+"""
+
+import importlib
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from backend.tests.test_utils import SimpleApiClient, register_mock_endpoints
+
+# The backend modules import each other by plain name, as they run from this directory
+BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+def pytest_configure(config):
+    """Register the markers used to select a subset of the suite"""
+    config.addinivalue_line('markers', 'fast: quick smoke tests of the read-only endpoints')
+    config.addinivalue_line('markers', 'slow: tests covering the fetch-data flow')
+
+
+@pytest.fixture(scope='session')
+def import_backend():
+    """Import a backend module by plain name, as the backend modules import each other"""
+    def import_module(name):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.syspath_prepend(BACKEND_DIR)
+            return importlib.import_module(name)
+    return import_module
+
+
+@pytest.fixture(scope='session')
+def api_mocker():
+    """One requests_mock.Mocker with every endpoint registered, shared by the whole run"""
+    with requests_mock.Mocker() as mocker:
+        register_mock_endpoints(mocker)
+        yield mocker
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_history(api_mocker):
+    """Clear the recorded requests between tests instead of rebuilding the mocks"""
+    yield
+    api_mocker.reset_mock()
+
+
+@pytest.fixture(scope='session')
+def mock_client(api_mocker):
+    """SimpleApiClient whose requests are answered by the shared api_mocker"""
+    yield SimpleApiClient('http://localhost:5000')
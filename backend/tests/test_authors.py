@@ -3,52 +3,23 @@
 Unit tests for the authors endpoint
 """
 
-import unittest
-import requests
-import requests_mock
-from datetime import datetime
+import orjson
 
-from backend.tests.test_utils import BASE_URL, SimpleApiClient, register_mock_endpoints
+from backend.tests.test_utils import START_DATE_STR, END_DATE_STR
 
 
-class AuthorsEndpointTest(unittest.TestCase):
-    """Test case for the authors endpoint"""
-    
-    def setUp(self):
-        """Set up test client and mock API"""
-        self.adapter = requests_mock.Adapter()
-        self.session = requests.Session()
-        self.session.mount('http://', self.adapter)
-        
-        # Set up datetime objects for testing
-        self.start_date = datetime(2025, 6, 1)
-        self.start_date_str = self.start_date.strftime("%Y-%m-%d")
-        self.end_date = datetime(2025, 7, 1)
-        self.end_date_str = self.end_date.strftime("%Y-%m-%d")
-        
-        # Register mock API endpoints
-        register_mock_endpoints(self.adapter)
-        
-        # Create simple API client using our session
-        self.client = SimpleApiClient('http://localhost:5000')
-        self.client.session = self.session
-    
-    def test_authors_endpoint(self):
-        """Test the authors endpoint"""
-        response = self.client.get_endpoint('authors', 
-                                      start_date=self.start_date_str,
-                                      end_date=self.end_date_str)
-        
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn('authors', data)
-        self.assertIn('count', data)
-        self.assertEqual(data['count'], 3)
-        self.assertEqual(len(data['authors']), 3)
-        self.assertIn('Author 1', data['authors'])
-        self.assertIn('Author 2', data['authors'])
-        self.assertIn('Author 3', data['authors'])
+def test_authors_endpoint(mock_client):
+    """Test the authors endpoint"""
+    response = mock_client.get_endpoint('authors',
+                                        start_date=START_DATE_STR,
+                                        end_date=END_DATE_STR)
 
-
-if __name__ == '__main__':
-    unittest.main()
+    assert response.status_code == 200
+    data = orjson.loads(response.content)
+    assert 'authors' in data
+    assert 'count' in data
+    assert data['count'] == 3
+    assert len(data['authors']) == 3
+    assert 'Author 1' in data['authors']
+    assert 'Author 2' in data['authors']
+    assert 'Author 3' in data['authors']
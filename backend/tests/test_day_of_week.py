@@ -3,58 +3,25 @@
 Unit tests for the day-of-week endpoint
 """
 
-import unittest
-import requests
-import requests_mock
-from datetime import datetime
+from operator import itemgetter
 
-from backend.tests.test_utils import BASE_URL, SimpleApiClient, register_mock_endpoints
+import orjson
 
+from backend.tests.test_utils import START_DATE_STR, END_DATE_STR
 
-class DayOfWeekEndpointTest(unittest.TestCase):
-    """Test case for the day-of-week endpoint"""
-    
-    def setUp(self):
-        """Set up test client and mock API"""
-        self.adapter = requests_mock.Adapter()
-        self.session = requests.Session()
-        self.session.mount('http://', self.adapter)
-        
-        # Set up datetime objects for testing
-        self.start_date = datetime(2025, 6, 1)
-        self.start_date_str = self.start_date.strftime("%Y-%m-%d")
-        self.end_date = datetime(2025, 7, 1)
-        self.end_date_str = self.end_date.strftime("%Y-%m-%d")
-        
-        # Register mock API endpoints
-        register_mock_endpoints(self.adapter)
-        
-        # Create simple API client using our session
-        self.client = SimpleApiClient('http://localhost:5000')
-        self.client.session = self.session
-    
-    def test_day_of_week_endpoint(self):
-        """Test the day-of-week endpoint"""
-        response = self.client.get_endpoint('day-of-week',
-                                     start_date=self.start_date_str,
-                                     end_date=self.end_date_str)
-        
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn('metric', data)
-        self.assertEqual(data['metric'], 'commits')
-        self.assertIn('day_activity', data)
-        
-        # Check specific day values
-        day_activity = data['day_activity']
-        self.assertEqual(day_activity['Sunday'], 10)
-        self.assertEqual(day_activity['Monday'], 15)
-        self.assertEqual(day_activity['Tuesday'], 0)
-        self.assertEqual(day_activity['Wednesday'], 0)
-        self.assertEqual(day_activity['Thursday'], 25)
-        self.assertEqual(day_activity['Friday'], 0)
-        self.assertEqual(day_activity['Saturday'], 0)
 
+def test_day_of_week_endpoint(mock_client):
+    """Test the day-of-week endpoint"""
+    response = mock_client.get_endpoint('day-of-week',
+                                        start_date=START_DATE_STR,
+                                        end_date=END_DATE_STR)
 
-if __name__ == '__main__':
-    unittest.main()
+    assert response.status_code == 200
+    data = orjson.loads(response.content)
+    assert 'metric' in data
+    assert data['metric'] == 'commits'
+    assert 'day_activity' in data
+
+    # Check specific day values
+    days = itemgetter('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+    assert days(data['day_activity']) == (10, 15, 0, 0, 25, 0, 0)
@@ -3,58 +3,93 @@
 Unit tests for the fetch-data endpoint
 """
 
-import unittest
-import requests
-import requests_mock
-from datetime import datetime
-
-from backend.tests.test_utils import BASE_URL, SimpleApiClient, register_mock_endpoints
-
-
-class FetchDataEndpointTest(unittest.TestCase):
-    """Test case for the fetch-data endpoint"""
-    
-    def setUp(self):
-        """Set up test client and mock API"""
-        self.adapter = requests_mock.Adapter()
-        self.session = requests.Session()
-        self.session.mount('http://', self.adapter)
-        
-        # Set up datetime objects for testing
-        self.start_date = datetime(2025, 6, 1)
-        self.start_date_str = self.start_date.strftime("%Y-%m-%d")
-        self.end_date = datetime(2025, 7, 1)
-        self.end_date_str = self.end_date.strftime("%Y-%m-%d")
-        
-        # Register mock API endpoints
-        register_mock_endpoints(self.adapter)
-        
-        # Create simple API client using our session
-        self.client = SimpleApiClient('http://localhost:5000')
-        self.client.session = self.session
-    
-    def test_fetch_data_endpoint(self):
-        """Test the fetch-data endpoint with cache"""
-        payload = {
-            'start_date': self.start_date_str,
-            'end_date': self.end_date_str,
-            'repo_owner': 'OpenRA',
-            'repo_name': 'OpenRA',
-            'use_cache': True
+from operator import itemgetter
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from backend.tests.test_utils import START_DATE_STR, END_DATE_STR
+
+PAYLOAD = {
+    'start_date': START_DATE_STR,
+    'end_date': END_DATE_STR,
+    'repo_owner': 'OpenRA',
+    'repo_name': 'OpenRA',
+    'use_cache': True
+}
+
+# (case, request, expected response values)
+CASES = [
+    ('cache hit', lambda client: client.fetch_data(PAYLOAD), {
+        'status': 'success',
+        'cache_used': True,
+        'repository': 'OpenRA/OpenRA',
+        'statistics': {
+            'commit_count': 2,
+            'mean_changes': 100.0,
+            'std_changes': 50.0
         }
-        response = self.client.fetch_data(payload)
-        
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn('status', data)
-        self.assertEqual(data['status'], 'success')
-        self.assertTrue(data['cache_used'])
-        self.assertEqual(data['repository'], 'OpenRA/OpenRA')
-        self.assertIn('statistics', data)
-        self.assertEqual(data['statistics']['commit_count'], 2)
-        self.assertEqual(data['statistics']['mean_changes'], 100.0)
-        self.assertEqual(data['statistics']['std_changes'], 50.0)
-
-
-if __name__ == '__main__':
-    unittest.main()
+    }),
+]
+
+JOB_RESULT = {
+    'status': 'success',
+    'cache_used': False,
+    'repository': 'OpenRA/OpenRA',
+    'commit_count': 2
+}
+
+# (case, job status, job result, job traceback, expected response)
+JOB_STATUS_CASES = [
+    ('queued', 'queued', None, None, {'job_id': 'test-job', 'status': 'queued'}),
+    ('finished', 'finished', JOB_RESULT, None, {'job_id': 'test-job', 'status': 'finished', 'result': JOB_RESULT}),
+    ('failed', 'failed', None, 'Traceback (most recent call last):\nRuntimeError: GitHub request still failing\n',
+     {'job_id': 'test-job', 'status': 'failed', 'message': 'RuntimeError: GitHub request still failing'}),
+]
+
+
+@pytest.fixture(scope='module')
+def api(import_backend):
+    """The Flask API module; its Redis and Postgres connections are only opened on use"""
+    return import_backend('api')
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('request_fn, expected', [case[1:] for case in CASES],
+                         ids=[case[0] for case in CASES])
+def test_fetch_data(mock_client, request_fn, expected):
+    """Test starting a fetch that is served from the cache"""
+    response = request_fn(mock_client)
+
+    assert response.status_code == 200
+    # Compare every expected key in one tuple
+    values = itemgetter(*expected)
+    assert values(orjson.loads(response.content)) == values(expected)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('status, result, exc_info, expected', [case[1:] for case in JOB_STATUS_CASES],
+                         ids=[case[0] for case in JOB_STATUS_CASES])
+def test_fetch_data_status(api, monkeypatch, status, result, exc_info, expected):
+    """Test the job status endpoint reports the RQ job's status, result or error"""
+    job = SimpleNamespace(id='test-job', get_status=lambda: status, result=result, exc_info=exc_info,
+                          is_finished=status == 'finished', is_failed=status == 'failed')
+    monkeypatch.setattr(api, 'Job', SimpleNamespace(fetch=lambda job_id, connection: job))
+
+    response = api.app.test_client().get('/api/v1/fetch-data/test-job')
+
+    assert response.status_code == 200
+    assert orjson.loads(response.data) == expected
+
+
+@pytest.mark.slow
+def test_fetch_data_status_unknown_job(api, monkeypatch):
+    """Test the job status endpoint answers 404 for a job RQ does not know"""
+    def fetch(job_id, connection):
+        raise api.NoSuchJobError(job_id)
+    monkeypatch.setattr(api, 'Job', SimpleNamespace(fetch=fetch))
+
+    response = api.app.test_client().get('/api/v1/fetch-data/missing-job')
+
+    assert response.status_code == 404
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the GitHub client, with GitHub's GraphQL API mocked
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+GRAPHQL_URL = 'https://api.github.com/graphql'
+RATE_LIMIT = {'limit': 5000, 'remaining': 4999, 'resetAt': '2025-07-01T00:00:00Z'}
+NOW = 1_750_000_000.0  # The client's clock during a test
+
+
+@pytest.fixture(scope='module')
+def github_client(import_backend):
+    """The github_client module, imported the way the backend imports it"""
+    return import_backend('github_client')
+
+
+@pytest.fixture
+def client(github_client):
+    """GitHubAPIClient that never touches Redis or Postgres"""
+    client = github_client.GitHubAPIClient(token='test-token', db_url='postgresql://test@localhost/test')
+    client.redis_client = None
+    client._rl_script = None
+    return client
+
+
+@pytest.fixture
+def sleeps(github_client, monkeypatch):
+    """Seconds each retry waited; the client's clock stands still at NOW and the jitter is zero"""
+    sleeps = []
+    monkeypatch.setattr(github_client, 'time', SimpleNamespace(time=lambda: NOW, sleep=sleeps.append))
+    monkeypatch.setattr(github_client, 'random', SimpleNamespace(uniform=lambda a, b: 0.0))
+    return sleeps
+
+
+def history(*shas, has_next_page=False):
+    """A repository's commit history page as the batched query returns it"""
+    return {'defaultBranchRef': {'target': {'history': {
+        'pageInfo': {'hasNextPage': has_next_page, 'endCursor': 'cursor'},
+        'nodes': [{'oid': sha} for sha in shas]
+    }}}}
+
+
+def test_fetch_commits_multi_skips_invalid_repository(client, requests_mock):
+    """A repository GitHub returns no history for is left out of the results and the cache"""
+    requests_mock.post(GRAPHQL_URL, json={'data': {
+        'repo0': history('a' * 40, 'b' * 40),
+        'repo1': None,
+        'rateLimit': RATE_LIMIT
+    }})
+    session = MagicMock()
+    session.query.return_value.filter.return_value.first.return_value = None
+    client.Session = lambda: session
+    client._store_commits_page = lambda session, repository, nodes: [node['oid'] for node in nodes]
+
+    results = client.fetch_commits_multi([('OpenRA', 'OpenRA'), ('OpenRA', 'missing')],
+                                         start_date=datetime(2025, 6, 1), end_date=datetime(2025, 7, 1))
+
+    assert requests_mock.call_count == 1
+    assert results == {'OpenRA/OpenRA': ['a' * 40, 'b' * 40]}
+    cached = [call.args[0] for call in session.add.call_args_list]
+    assert [(status.repository, status.completed) for status in cached] == [('OpenRA/OpenRA', True)]
+
+
+@pytest.mark.parametrize('status', [403, 429, 502, 503])
+def test_execute_query_waits_for_retry_after(client, requests_mock, sleeps, status):
+    """Throttled and failed requests are retried after the wait GitHub asks for"""
+    requests_mock.post(GRAPHQL_URL, [
+        {'status_code': status, 'headers': {'Retry-After': '7'}},
+        {'status_code': status, 'headers': {'Retry-After': '3'}},
+        {'json': {'data': {'viewer': {'login': 'octocat'}}}},
+    ])
+
+    assert client._execute_query('query', {}) == {'viewer': {'login': 'octocat'}}
+    assert requests_mock.call_count == 3
+    assert sleeps == [7.0, 3.0]
+
+
+def test_execute_query_gives_up_after_max_attempts(github_client, client, requests_mock, sleeps):
+    """Server errors without Retry-After back off exponentially, with no wait after the last attempt"""
+    requests_mock.post(GRAPHQL_URL, status_code=502)
+
+    with pytest.raises(RuntimeError):
+        client._execute_query('query', {})
+    assert requests_mock.call_count == github_client.MAX_QUERY_ATTEMPTS
+    assert sleeps == [github_client.BACKOFF_BASE_SECONDS * 2 ** attempt
+                      for attempt in range(github_client.MAX_QUERY_ATTEMPTS - 1)]
+
+
+def test_execute_query_does_not_retry_forbidden(client, requests_mock, sleeps):
+    """A 403 that is not a rate limit fails at once"""
+    requests_mock.post(GRAPHQL_URL, status_code=403, text='Resource not accessible by integration')
+
+    with pytest.raises(requests.HTTPError, match='403'):
+        client._execute_query('query', {})
+    assert requests_mock.call_count == 1
+    assert sleeps == []
+
+
+# (case, mocked response, attempt, expected wait in seconds or None)
+RATE_LIMIT_DELAY_CASES = [
+    ('retry after', {'status_code': 429, 'headers': {'Retry-After': '5'}}, 0, 5.0),
+    ('primary limit', {'status_code': 403, 'headers': {'X-RateLimit-Remaining': '0',
+                                                       'X-RateLimit-Reset': str(int(NOW) + 30)}}, 0, 30.0),
+    ('secondary limit', {'status_code': 403, 'text': 'You have exceeded a secondary rate limit'}, 2, 40.0),
+    ('server error', {'status_code': 503}, 1, 20.0),
+    ('forbidden', {'status_code': 403, 'text': 'Forbidden'}, 0, None),
+]
+
+
+@pytest.mark.parametrize('mocked, attempt, expected', [case[1:] for case in RATE_LIMIT_DELAY_CASES],
+                         ids=[case[0] for case in RATE_LIMIT_DELAY_CASES])
+def test_rate_limit_delay(client, requests_mock, sleeps, mocked, attempt, expected):
+    """The wait before a retry follows Retry-After, the reset time or exponential backoff"""
+    requests_mock.post(GRAPHQL_URL, **mocked)
+    response = client._http.post(GRAPHQL_URL)
+    client._update_rate_limit(response.headers)
+
+    delay = client._rate_limit_delay(response, attempt)
+
+    assert delay == expected
+
+
+# (message, expected words)
+TOKENIZE_CASES = [
+    ('Fix the bug in the parser', ['fix', 'bug', 'parser']),
+    ('Update README.md for v2', ['update', 'readme', 'md', 'v2']),
+    ('Merge: I did it, 1st try', ['merge', 'did', 'try']),
+    ('', []),
+]
+
+
+@pytest.mark.parametrize('message, expected', TOKENIZE_CASES)
+def test_tokenize_message(github_client, message, expected):
+    """Messages are lower-cased and split into words, without stop words or single letters"""
+    assert list(github_client.tokenize_message(message)) == expected
@@ -3,39 +3,14 @@
 Unit tests for the health endpoint
 """
 
-import unittest
-import requests
-import requests_mock
-from datetime import datetime
+import orjson
 
-from backend.tests.test_utils import BASE_URL, SimpleApiClient, register_mock_endpoints
 
+def test_health_check(mock_client):
+    """Test the health check endpoint"""
+    response = mock_client.get_endpoint('health')
 
-class HealthEndpointTest(unittest.TestCase):
-    """Test case for the health endpoint"""
-    
-    def setUp(self):
-        """Set up test client and mock API"""
-        self.adapter = requests_mock.Adapter()
-        self.session = requests.Session()
-        self.session.mount('http://', self.adapter)
-        
-        # Register mock API endpoints
-        register_mock_endpoints(self.adapter)
-        
-        # Create simple API client using our session
-        self.client = SimpleApiClient('http://localhost:5000')
-        self.client.session = self.session
-    
-    def test_health_check(self):
-        """Test the health check endpoint"""
-        response = self.client.get_endpoint('health')
-        
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn('status', data)
-        self.assertEqual(data['status'], 'ok')
-
-
-if __name__ == '__main__':
-    unittest.main()
+    assert response.status_code == 200
+    data = orjson.loads(response.content)
+    assert 'status' in data
+    assert data['status'] == 'ok'
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the commit statistics kernels
+"""
+
+import numpy as np
+import pytest
+
+RANDOM_VALUES = np.random.default_rng(0).exponential(100.0, 10_000)
+
+@pytest.fixture(scope='module')
+def stats(import_backend):
+    """The stats module under the name the backend imports it by, which its numba cache is keyed on"""
+    return import_backend('stats')
+
+
+# (case, values, expected mean, expected population std)
+CASES = [
+    ('empty', [], 0.0, 0.0),
+    ('constant', [5, 5, 5], 5.0, 0.0),
+    ('small', [1, 2, 3, 4], 2.5, 1.25 ** 0.5),
+    ('large', RANDOM_VALUES, RANDOM_VALUES.mean(), RANDOM_VALUES.std()),
+]
+
+
+@pytest.mark.parametrize('values, mean, std', [case[1:] for case in CASES],
+                         ids=[case[0] for case in CASES])
+def test_moments(stats, values, mean, std):
+    """moments returns the mean and population standard deviation as plain floats"""
+    result = stats.moments(values)
+
+    assert result == (pytest.approx(mean), pytest.approx(std))
+    assert all(type(value) is float for value in result)
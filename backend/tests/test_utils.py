@@ -3,20 +3,24 @@
 Test utilities for GitHub Analytics API endpoints using requests-mock
 """
 
-import sys
-import os
-import json
+import orjson
 import requests
-import requests_mock
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlencode
 
-# Add parent directory to path to import from backend
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 # Base URL for our mock API
 BASE_URL = 'http://localhost:5000/api/v1'
 
+# Fixed date range shared by every test
+START_DATE_STR = '2025-06-01'
+END_DATE_STR = '2025-07-01'
+
+# One session shared by every client, as in cli.py; the pool blocks rather than opening extra sockets
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=20, pool_block=True))
+
 
 # Simple API client for testing
 class SimpleApiClient:
@@ -25,19 +29,30 @@ class SimpleApiClient:
     def __init__(self, base_url):
         """Initialize with the base API URL"""
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.session = SESSION
+        # The fetch-data URLs are fixed, so build them once
+        self._fetch_data_url = f"{self.base_url}/api/v1/fetch-data"
     
-    def get_endpoint(self, endpoint, **params):
-        """Make a GET request to the specified endpoint with params"""
-        url = f"{self.base_url}/api/v1/{endpoint}"
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _build_url(base_url, endpoint, params):
+        """Build the URL for an endpoint and a tuple of query params; repeat calls hit the cache"""
+        url = f"{base_url}/api/v1/{endpoint}"
         if params:
             url = f"{url}?{urlencode(params)}"
-        return self.session.get(url)
+        return url
+    
+    def get_endpoint(self, endpoint, **params):
+        """Make a GET request to the specified endpoint with params"""
+        return self.session.get(self._build_url(self.base_url, endpoint, tuple(params.items())))
     
     def fetch_data(self, payload):
         """Make a POST request to the fetch-data endpoint"""
-        url = f"{self.base_url}/api/v1/fetch-data"
-        return self.session.post(url, json=payload)
+        return self.session.post(self._fetch_data_url, json=payload)
+    
+    def fetch_data_status(self, job_id):
+        """Make a GET request for the status of a queued fetch-data job"""
+        return self.session.get(f"{self._fetch_data_url}/{job_id}")
 
 
 # Mock response data for various endpoints
@@ -105,48 +120,56 @@ mock_responses = {
             'mean_changes': 100.0,
             'std_changes': 50.0
         }
+    },
+    'fetch-data-status': {
+        'job_id': 'test-job',
+        'status': 'finished',
+        'result': {
+            'status': 'success',
+            'cache_used': False,
+            'repository': 'OpenRA/OpenRA',
+            'commit_count': 2
+        }
     }
 }
 
 
-def register_mock_endpoints(adapter):
-    """Register all mock API endpoints on the requests_mock adapter"""
-    # Health check endpoint
-    adapter.register_uri(
-        'GET', f'{BASE_URL}/health',
-        json=mock_responses['health']
-    )
-    
-    # Authors endpoint
-    adapter.register_uri(
-        'GET', requests_mock.ANY,
-        json=mock_responses['authors'],
-        additional_matcher=lambda r: r.path.startswith('/api/v1/authors')
-    )
-    
-    # Deviations endpoint
-    adapter.register_uri(
-        'GET', requests_mock.ANY,
-        json=mock_responses['deviations'],
-        additional_matcher=lambda r: r.path.startswith('/api/v1/deviations')
-    )
-    
-    # Day-of-week endpoint
-    adapter.register_uri(
-        'GET', requests_mock.ANY,
-        json=mock_responses['day-of-week'],
-        additional_matcher=lambda r: r.path.startswith('/api/v1/day-of-week')
-    )
-    
-    # Word frequencies endpoint
-    adapter.register_uri(
-        'GET', requests_mock.ANY,
-        json=mock_responses['word-frequencies'],
-        additional_matcher=lambda r: r.path.startswith('/api/v1/word-frequencies')
-    )
-    
-    # Fetch data endpoint
-    adapter.register_uri(
-        'POST', f'{BASE_URL}/fetch-data',
-        json=mock_responses['fetch-data']
-    )
+# Response bodies serialized once at import and served as-is by every mock
+_CACHED_BODIES = MappingProxyType({endpoint: orjson.dumps(body) for endpoint, body in mock_responses.items()})
+
+
+def _freeze(value):
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Shared by every test, so make accidental mutation an error; the bodies above were encoded first
+mock_responses = _freeze(mock_responses)
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# (method, mock_responses key, path under BASE_URL) for every mocked endpoint
+_ROUTES = (
+    ('GET', 'health', 'health'),
+    ('GET', 'authors', 'authors'),
+    ('GET', 'deviations', 'deviations'),
+    ('GET', 'day-of-week', 'day-of-week'),
+    ('GET', 'word-frequencies', 'word-frequencies'),
+    ('POST', 'fetch-data', 'fetch-data'),
+    ('GET', 'fetch-data-status', 'fetch-data/test-job'),
+)
+
+
+def register_mock_endpoints(adapter, *endpoints):
+    """
+    Register mock API endpoints on a requests_mock Adapter or Mocker.
+    Only the named endpoints (keys of mock_responses) are registered when any are given.
+    """
+    wanted = set(endpoints or mock_responses)
+    for method, name, path in _ROUTES:
+        if name in wanted:
+            adapter.register_uri(method, f'{BASE_URL}/{path}',
+                                 content=_CACHED_BODIES[name], headers=JSON_HEADERS)
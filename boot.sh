@@ -81,9 +81,15 @@ echo -e "\n${YELLOW}Starting backend server...${NC}"
 cd $BACKEND_DIR
 python app.py &
 BACKEND_PID=$!
+
+# Start the worker that runs queued fetch-data jobs
+echo -e "\n${YELLOW}Starting fetch worker...${NC}"
+rq worker github --url $REDIS_URL &
+WORKER_PID=$!
 cd ..
 
 echo -e "\n${GREEN}Backend server started with PID $BACKEND_PID${NC}"
+echo -e "${GREEN}Fetch worker started with PID $WORKER_PID${NC}"
 echo -e "${GREEN}API URL: http://localhost:5050/api/v1${NC}"
 
 # Function to handle script termination
@@ -92,6 +98,9 @@ function cleanup {
     if [ ! -z "$BACKEND_PID" ]; then
         kill $BACKEND_PID 2>/dev/null
     fi
+    if [ ! -z "$WORKER_PID" ]; then
+        kill $WORKER_PID 2>/dev/null
+    fi
     echo -e "${GREEN}Goodbye!${NC}"
 }
 
@@ -1,7 +1,7 @@
 -- Create the commits table
 CREATE TABLE IF NOT EXISTS commits (
     id SERIAL PRIMARY KEY,
-    sha VARCHAR(40) UNIQUE NOT NULL,
+    sha CHAR(40) UNIQUE NOT NULL,
     author_name VARCHAR(255) NOT NULL,
     author_email VARCHAR(255),
     author_date TIMESTAMP NOT NULL,
@@ -9,8 +9,8 @@ CREATE TABLE IF NOT EXISTS commits (
     message_body TEXT,
     additions INTEGER DEFAULT 0,
     deletions INTEGER DEFAULT 0,
-    total_changes INTEGER DEFAULT 0,
-    repository VARCHAR(255) NOT NULL,
+    total_changes INTEGER GENERATED ALWAYS AS (additions + deletions) STORED,
+    repository VARCHAR(140) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     z_score FLOAT
 );
@@ -18,7 +18,7 @@ CREATE TABLE IF NOT EXISTS commits (
 -- Create the cache_status table
 CREATE TABLE IF NOT EXISTS cache_status (
     id SERIAL PRIMARY KEY,
-    repository VARCHAR(255) NOT NULL,
+    repository VARCHAR(140) NOT NULL,
     start_date TIMESTAMP NOT NULL,
     end_date TIMESTAMP NOT NULL,
     last_cursor VARCHAR(255),
@@ -31,14 +31,45 @@ CREATE TABLE IF NOT EXISTS commit_word_frequencies (
     id SERIAL PRIMARY KEY,
     word VARCHAR(100) NOT NULL,
     frequency INTEGER DEFAULT 0,
-    repository VARCHAR(255) NOT NULL,
+    repository VARCHAR(140) NOT NULL,
     start_date TIMESTAMP NOT NULL,
-    end_date TIMESTAMP NOT NULL
+    end_date TIMESTAMP NOT NULL,
+    CONSTRAINT uq_cwf UNIQUE (word, repository, start_date, end_date)
+);
+
+-- Create the commit_dow_rollup table
+CREATE TABLE IF NOT EXISTS commit_dow_rollup (
+    author_name VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    dow SMALLINT NOT NULL,
+    commits INTEGER DEFAULT 0,
+    additions INTEGER DEFAULT 0,
+    deletions INTEGER DEFAULT 0,
+    total_changes INTEGER GENERATED ALWAYS AS (additions + deletions) STORED,
+    PRIMARY KEY (author_name, day)
+);
+
+-- Create the words and commit_words tables
+CREATE TABLE IF NOT EXISTS words (
+    id SERIAL PRIMARY KEY,
+    word TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS commit_words (
+    commit_id INTEGER NOT NULL REFERENCES commits(id) ON DELETE CASCADE,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    repository VARCHAR(140) NOT NULL,
+    author_date TIMESTAMP NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (commit_id, word_id)
 );
 
 -- Add some indexes to improve query performance
-CREATE INDEX IF NOT EXISTS idx_commits_author_date ON commits(author_date);
-CREATE INDEX IF NOT EXISTS idx_commits_author_name ON commits(author_name);
-CREATE INDEX IF NOT EXISTS idx_commits_repository ON commits(repository);
-CREATE INDEX IF NOT EXISTS idx_cache_status_repository ON cache_status(repository);
+CREATE INDEX IF NOT EXISTS commits_author_date_idx ON commits(author_date) INCLUDE (author_name, additions, deletions, total_changes, z_score);
+CREATE INDEX IF NOT EXISTS commits_author_name_date_idx ON commits(author_name, author_date) INCLUDE (additions, deletions, total_changes);
+CREATE INDEX IF NOT EXISTS commits_repo_date_idx ON commits(repository, author_date);
+CREATE INDEX IF NOT EXISTS commits_zscore_idx ON commits(author_date) WHERE z_score > 2;
+CREATE INDEX IF NOT EXISTS cache_status_repo_range_idx ON cache_status(repository, start_date, end_date);
 CREATE INDEX IF NOT EXISTS idx_word_frequencies_word ON commit_word_frequencies(word);
+CREATE INDEX IF NOT EXISTS cwf_range_freq_idx ON commit_word_frequencies(start_date, end_date, frequency DESC) INCLUDE (word);
+CREATE INDEX IF NOT EXISTS commit_words_date_word_idx ON commit_words(author_date, word_id) INCLUDE (occurrences);
@@ -3,7 +3,7 @@
 -- Create the commits table
 CREATE TABLE IF NOT EXISTS commits (
     id SERIAL PRIMARY KEY,
-    sha VARCHAR(40) UNIQUE NOT NULL,
+    sha CHAR(40) UNIQUE NOT NULL,
     author_name VARCHAR(255) NOT NULL,
     author_email VARCHAR(255),
     author_date TIMESTAMP NOT NULL,
@@ -11,25 +11,30 @@ CREATE TABLE IF NOT EXISTS commits (
     message_body TEXT,
     additions INTEGER DEFAULT 0,
     deletions INTEGER DEFAULT 0,
-    total_changes INTEGER DEFAULT 0,
-    repository VARCHAR(255) NOT NULL,
+    total_changes INTEGER GENERATED ALWAYS AS (additions + deletions) STORED,
+    repository VARCHAR(140) NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     z_score FLOAT
 );
 
--- Create index on author_name for faster queries on author-specific data
-CREATE INDEX IF NOT EXISTS idx_commits_author_name ON commits(author_name);
+-- Covering index on author_name for author-specific queries (index-only scans)
+CREATE INDEX IF NOT EXISTS commits_author_name_date_idx ON commits(author_name, author_date)
+    INCLUDE (additions, deletions, total_changes);
 
--- Create index on author_date for date range queries
-CREATE INDEX IF NOT EXISTS idx_commits_author_date ON commits(author_date);
+-- Covering index on author_date for date range queries (index-only scans)
+CREATE INDEX IF NOT EXISTS commits_author_date_idx ON commits(author_date)
+    INCLUDE (author_name, additions, deletions, total_changes, z_score);
 
--- Create index on repository to filter by repo
-CREATE INDEX IF NOT EXISTS idx_commits_repository ON commits(repository);
+-- Repository and date range, the filter of the cache and statistics queries
+CREATE INDEX IF NOT EXISTS commits_repo_date_idx ON commits(repository, author_date);
+
+-- Partial index covering only the significant deviations (z-score > 2)
+CREATE INDEX IF NOT EXISTS commits_zscore_idx ON commits(author_date) WHERE z_score > 2;
 
 -- Create the cache_status table to track data fetch progress
 CREATE TABLE IF NOT EXISTS cache_status (
     id SERIAL PRIMARY KEY,
-    repository VARCHAR(255) NOT NULL,
+    repository VARCHAR(140) NOT NULL,
     start_date TIMESTAMP NOT NULL,
     end_date TIMESTAMP NOT NULL,
     last_cursor VARCHAR(255),
@@ -38,21 +43,61 @@ CREATE TABLE IF NOT EXISTS cache_status (
     UNIQUE (repository, start_date, end_date)
 );
 
+-- Repository and date range, the cache lookup done before every fetch
+CREATE INDEX IF NOT EXISTS cache_status_repo_range_idx ON cache_status(repository, start_date, end_date);
+
 -- Create the commit word frequencies table for word cloud data
 CREATE TABLE IF NOT EXISTS commit_word_frequencies (
     id SERIAL PRIMARY KEY,
     word VARCHAR(100) NOT NULL,
     frequency INTEGER DEFAULT 0,
-    repository VARCHAR(255) NOT NULL,
+    repository VARCHAR(140) NOT NULL,
     start_date TIMESTAMP NOT NULL,
     end_date TIMESTAMP NOT NULL,
-    UNIQUE (word, repository, start_date, end_date)
+    CONSTRAINT uq_cwf UNIQUE (word, repository, start_date, end_date)
 );
 
 -- Create index on word frequency for efficient retrieval
 CREATE INDEX IF NOT EXISTS idx_word_frequency ON commit_word_frequencies(frequency DESC);
 
+-- Covering index for the top-N words of a date range
+CREATE INDEX IF NOT EXISTS cwf_range_freq_idx ON commit_word_frequencies(start_date, end_date, frequency DESC)
+    INCLUDE (word);
+
+-- Create the per-author, per-day rollup used by the day-of-week endpoint
+CREATE TABLE IF NOT EXISTS commit_dow_rollup (
+    author_name VARCHAR(255) NOT NULL,
+    day DATE NOT NULL,
+    dow SMALLINT NOT NULL,
+    commits INTEGER DEFAULT 0,
+    additions INTEGER DEFAULT 0,
+    deletions INTEGER DEFAULT 0,
+    total_changes INTEGER GENERATED ALWAYS AS (additions + deletions) STORED,
+    PRIMARY KEY (author_name, day)
+);
+
+-- Distinct commit message words, referenced by integer id
+CREATE TABLE IF NOT EXISTS words (
+    id SERIAL PRIMARY KEY,
+    word TEXT UNIQUE NOT NULL
+);
+
+-- Words of each commit message, tokenized once at ingest
+CREATE TABLE IF NOT EXISTS commit_words (
+    commit_id INTEGER NOT NULL REFERENCES commits(id) ON DELETE CASCADE,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    repository VARCHAR(140) NOT NULL,
+    author_date TIMESTAMP NOT NULL,
+    occurrences INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (commit_id, word_id)
+);
+
+-- Word counts for a date range are summed from this index
+CREATE INDEX IF NOT EXISTS commit_words_date_word_idx ON commit_words(author_date, word_id) INCLUDE (occurrences);
+
 -- Ensure we're capturing stats for our DB
 COMMENT ON TABLE commits IS 'Table storing GitHub commit data for analytics';
 COMMENT ON TABLE cache_status IS 'Tracks progress of GitHub API data fetches for resumable operations';
 COMMENT ON TABLE commit_word_frequencies IS 'Pre-computed word frequencies for commit messages';
+COMMENT ON TABLE commit_dow_rollup IS 'Per-author daily commit totals for day-of-week analytics';
+COMMENT ON TABLE commit_words IS 'Commit message words tokenized at ingest for word frequency analytics';
@@ -28,6 +28,43 @@ const formatDate = (date) => {
   return date.toISOString().split('T')[0];
 };
 
+// A job still queued after this long means no worker picked it up
+const JOB_QUEUED_TIMEOUT_MS = 60000;
+// Used when the API does not report the job's own timeout
+const DEFAULT_JOB_TIMEOUT_S = 3600;
+
+/**
+ * Error reported by a fetch-data job, as opposed to a failed request
+ */
+class FetchJobError extends Error {}
+
+/**
+ * Poll a queued fetch-data job until it finishes, fails or runs out of time
+ * @param {string} jobId - Job id returned by /fetch-data
+ * @param {number} jobTimeout - Seconds the job may run, from the /fetch-data response
+ * @param {number} interval - Polling interval in milliseconds
+ * @returns {Promise<Object>} Job result
+ */
+async function waitForFetchJob(jobId, jobTimeout = DEFAULT_JOB_TIMEOUT_S, interval = 2000) {
+  const queuedDeadline = Date.now() + JOB_QUEUED_TIMEOUT_MS;
+  const deadline = queuedDeadline + jobTimeout * 1000;
+  for (;;) {
+    await new Promise((resolve) => setTimeout(resolve, interval));
+    const response = await api.get(`/fetch-data/${jobId}`);
+    const { status } = response.data;
+    if (status === 'finished') return response.data.result;
+    if (['failed', 'stopped', 'canceled'].includes(status)) {
+      throw new FetchJobError(response.data.message || `Fetch job ${status}`);
+    }
+    if (status === 'queued' && Date.now() > queuedDeadline) {
+      throw new FetchJobError('The fetch was not started. Is the fetch worker (rq worker github) running?');
+    }
+    if (Date.now() > deadline) {
+      throw new FetchJobError(`The fetch did not finish in time (last status: ${status})`);
+    }
+  }
+}
+
 /**
  * Get list of authors who have committed in the date range
  * @param {Object} params - Request parameters
@@ -192,17 +229,23 @@ export async function fetchData({
   useCache = true,
 }) {
   try {
-    // Use a longer timeout for this specific operation since fetching GitHub data can take time
     const response = await api.post('/fetch-data', {
       start_date: formatDate(startDate),
       end_date: formatDate(endDate),
       repo_owner: repoOwner,
       repo_name: repoName,
       use_cache: useCache,
-    }, {
-      timeout: 60000, // 60 seconds timeout for GitHub data fetching
     });
     
+    // 202 means the fetch was queued on the worker; poll the job until it is done
+    if (response.status === 202) {
+      const result = await waitForFetchJob(response.data.job_id, response.data.job_timeout);
+      return {
+        success: result.status === 'success',
+        message: result.message,
+      };
+    }
+    
     return {
       success: response.data.status === 'success',
       message: response.data.message,
@@ -211,7 +254,9 @@ export async function fetchData({
     console.error('Error fetching data from GitHub:', error);
     return {
       success: false,
-      message: error.response?.data?.message || 'Failed to fetch data from GitHub',
+      message: error instanceof FetchJobError
+        ? error.message
+        : error.response?.data?.message || 'Failed to fetch data from GitHub',
     };
   }
 }